@@ -1,11 +1,10 @@
-import re
-from collections import MutableMapping, OrderedDict, Sequence
+from collections.abc import MutableMapping, Sequence
 from datetime import datetime
-from itertools import chain
-from textwrap import dedent
+from functools import lru_cache
+from itertools import islice
+from os.path import commonprefix
 
 from .exc import RTConversionError
-from .patterns import CUSTOM_FIELD_RE, KEY_VALUE_LINE
 
 
 DATETIME_FORMATS = (
@@ -13,11 +12,45 @@ DATETIME_FORMATS = (
     '%Y-%m-%d %H:%M:%S',
 )
 
+# Characters other than word characters that may appear in a key. See
+# KEY_VALUE_LINE in the patterns module.
+KEY_PUNCTUATION = str.maketrans('', '', '_ -')
+
 
 def content_to_lines(content):
     return content.splitlines()
 
 
+def iter_content_lines(content, chunk_size=65536):
+    """Iterate over the lines of ``content`` lazily.
+
+    This produces the same lines as :func:`content_to_lines`, but the
+    content is split a chunk at a time so that large responses are
+    never split into one big list of lines::
+
+        >>> list(iter_content_lines('a\\nb\\r\\nc\\n\\nd', chunk_size=1))
+        ['a', 'b', 'c', '', 'd']
+
+    Each chunk ends just after a newline. A newline can't be the start
+    of a longer line boundary (like ``\\r\\n``), so splitting in chunks
+    doesn't change where lines are broken.
+
+    Args:
+        content (str): RT response content
+        chunk_size (int): Approximate number of characters to split at
+            a time
+
+    """
+    start = 0
+    length = len(content)
+    while start < length:
+        end = content.find('\n', start + chunk_size)
+        end = length if end == -1 else end + 1
+        yield from content[start:end].splitlines()
+        start = end
+
+
+@lru_cache(maxsize=256)
 def parse_cf_name(name):
     """Parse custom field name from ``name``.
 
@@ -29,18 +62,121 @@ def parse_cf_name(name):
             'CF.{XXX}'
         None: If ``name`` isn't formatted as a custom field name
 
+    This is equivalent to matching against ``CUSTOM_FIELD_RE``,
+    but it uses plain string operations since it's called for every
+    key access on :class:`RTCustomFields`. Results are cached since
+    the same handful of field names are seen over and over::
+
+        >>> parse_cf_name('CF.{XYZ}')
+        'XYZ'
+        >>> parse_cf_name('XYZ') is None
+        True
+        >>> parse_cf_name('CF.{}') is None
+        True
+
+    """
+    if name.startswith('CF.{') and name.endswith('}'):
+        cf_name = name[4:-1]
+        if cf_name and '{' not in cf_name and '}' not in cf_name:
+            return cf_name
+
+
+def parse_key_line(line):
+    """Parse key and value from a key line like 'Key: value'.
+
+    This is equivalent to matching against ``KEY_VALUE_LINE``, except
+    that lines starting with whitespace are never considered key lines
+    (they're continuation lines). It uses plain string operations since
+    it's called for every line of every response::
+
+        >>> parse_key_line('Subject: Hello')
+        ('Subject', 'Hello')
+        >>> parse_key_line('CF.{Some: Field}:   value')
+        ('CF.{Some: Field}', 'value')
+        >>> parse_key_line('Created?:')
+        ('Created?', '')
+        >>> parse_key_line('   Subject: Hello') is None
+        True
+        >>> parse_key_line('Not.A.Key: value') is None
+        True
+
+    Args:
+        line (str): A line from an RT response
+
+    Returns:
+        tuple: (key, value) if ``line`` is a key line
+        None: If ``line`` isn't a key line
+
     """
-    cf_match = re.search(CUSTOM_FIELD_RE, name)
-    if cf_match:
-        cf_name = cf_match.group('name')
-        return cf_name
+    if line.startswith('CF.{'):
+        colon = line.find('}') + 1
+        if not colon or not parse_cf_name(line[:colon]):
+            return None
+    else:
+        colon = line.find(':')
+        if colon < 1:
+            return None
+        name = line[:colon - 1] if line[colon - 1] == '?' else line[:colon]
+        if not name or line[0] == ' ':
+            return None
+        name = name.translate(KEY_PUNCTUATION)
+        if name and not name.isalnum():
+            return None
+    if line[colon:colon + 1] != ':':
+        return None
+    return line[:colon], line[colon + 1:].lstrip()
+
+
+def dedent_lines(lines):
+    """Remove common leading whitespace from ``lines``.
+
+    This is equivalent to ``textwrap.dedent('\\n'.join(lines))``, but
+    it works on the lines directly instead of using regular expressions
+    to split them back out::
+
+        >>> dedent_lines(['    a', '', '      b', '   ', '    c'])
+        'a\\n\\n  b\\n\\nc'
+
+    Lines consisting solely of spaces and tabs are normalized to empty
+    lines and ignored when determining the common whitespace.
+
+    """
+    margin = None
+    for line in lines:
+        content = line.lstrip(' \t')
+        if content:
+            indentation = line[:len(line) - len(content)]
+            if margin is None:
+                margin = indentation
+            elif not indentation.startswith(margin):
+                margin = commonprefix((margin, indentation))
+    start = len(margin) if margin else 0
+    return '\n'.join(line[start:] if line.strip(' \t') else '' for line in lines)
+
+
+def join_value(value, continuation_lines):
+    """Join the first line of a value with its continuation lines.
+
+    The continuation lines are dedented (see :func:`dedent_lines`), and
+    leading and trailing whitespace is stripped from the joined value.
+
+    """
+    if continuation_lines:
+        continuation = dedent_lines(continuation_lines)
+        value = f'{value}\n{continuation}' if value else continuation
+    return value.strip()
 
 
 def to_cf_name(name):
     """Format field name as a custom field name.
 
     If the field name is already formatted as a custom field name, it
-    will be return as is.
+    will be returned as is::
+
+        >>> to_cf_name('XXX')
+        'CF.{XXX}'
+        >>> to_cf_name('CF.{XXX}')
+        'CF.{XXX}'
 
     Args:
         name: A field name
@@ -50,11 +186,12 @@ def to_cf_name(name):
 
 
     """
-    cf_name = parse_cf_name(name)
-    return cf_name or 'CF.{%s}' % name
+    if parse_cf_name(name):
+        return name
+    return f'CF.{{{name}}}'
 
 
-class RTData(OrderedDict):
+class RTData(dict):
 
     """Container for RT data.
 
@@ -97,14 +234,85 @@ class RTData(OrderedDict):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.custom_fields = RTCustomFields(self)
+        self.custom_fields._add_all(self)
+
+    # The methods below keep the custom fields index in sync with the
+    # container. dict's C-level bulk operations don't go through
+    # __setitem__ or __delitem__, so they have to be handled too.
+
+    def __setitem__(self, name, value):
+        super().__setitem__(name, value)
+        self.custom_fields._add(name)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self.custom_fields._discard(name)
+
+    def update(self, *args, **kwargs):
+        # New keys are always added at the end.
+        size = len(self)
+        super().update(*args, **kwargs)
+        self.custom_fields._add_all(islice(self, size, None))
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    # Like OrderedDict, merging returns an instance of this class rather
+    # than a plain dict.
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.__class__(self)
+        new.update(other)
+        return new
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.__class__(other)
+        new.update(self)
+        return new
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def pop(self, name, *default):
+        value = super().pop(name, *default)
+        self.custom_fields._discard(name)
+        return value
+
+    def popitem(self):
+        name, value = super().popitem()
+        self.custom_fields._discard(name)
+        return name, value
+
+    def clear(self):
+        super().clear()
+        self.custom_fields._clear()
+
+    def copy(self):
+        return self.__class__(self)
+
+    def __reduce__(self):
+        # custom_fields is bound to this instance, so it's rebuilt when
+        # copying/unpickling instead of being shared with the copy.
+        return self.__class__, (list(self.items()),)
+
+    def __repr__(self):
+        return '{name}({items})'.format(name=self.__class__.__name__, items=super().__repr__())
 
     @classmethod
     def from_lines(cls, lines):
         """Create instance from lines of data.
 
         Args:
-            lines (list): The content lines of an RT response. I.e., the
-                part of the response text after the meta and detail lines.
+            lines (iterable): The content lines of an RT response. I.e.,
+                the part of the response text after the meta and detail
+                lines. The lines are consumed in a single pass.
 
                 Note: line endings *should* be stripped from each line
                 but other leading and trailing whitespace should *not*
@@ -125,34 +333,32 @@ class RTData(OrderedDict):
         is preserved.
 
         """
-        data = []
-        key_lines = []
-
-        # Find & save lines containing keys
-        for i, line in enumerate(lines):
-            if not line or line.startswith('#'):
-                continue
-            match = re.search(KEY_VALUE_LINE, line)
-            if match:
-                key_lines.append((i, match.group('key'), match.group('value')))
-            elif not line.startswith(' '):
-                raise ValueError(
-                    'Expected a continuation line starting with a space; got "%s"' % line)
-
-        # Extract value for each key found above
-        eof = (len(lines), None, None)
-        for line, next_line in zip(key_lines, chain(key_lines[1:], [eof])):
-            value = []
-            i, key, start_value = line
-            j, *rest = next_line
-            continuation_lines = lines[(i + 1):j]
-            if start_value:
-                value.append(start_value)
-            if continuation_lines:
-                continuation_lines = dedent('\n'.join(continuation_lines))
-                value.append(continuation_lines)
-            data.append((key, '\n'.join(value).strip()))
-
+        data = {}
+        key = value = None
+        continuation_lines = []
+        parse = parse_key_line
+
+        # Blank and comment lines following a key line are treated as
+        # continuation lines. Continuation lines before the first key
+        # line are ignored.
+        for line in lines:
+            if line and line[0] not in '# ':
+                key_value = parse(line)
+                if key_value is None:
+                    raise ValueError(
+                        'Expected a continuation line starting with a space; got "%s"' % line)
+                if key is not None:
+                    data[key] = join_value(value, continuation_lines)
+                key, value = key_value
+                continuation_lines = []
+            elif key is not None:
+                continuation_lines.append(line)
+
+        if key is not None:
+            data[key] = join_value(value, continuation_lines)
+
+        # Constructing from a dict is a bulk copy; RTData only has to
+        # index the custom fields afterwards.
         return cls(data)
 
     @classmethod
@@ -184,16 +390,22 @@ class RTMultipartData(Sequence):
     @classmethod
     def from_lines(cls, lines):
         # TODO: Extract detail lines?
+        # Parts are separated by "--" lines surrounded by blank lines.
+        # One line of lookahead is kept so that ``lines`` can be any
+        # iterable (e.g., an iterator that's partially consumed).
         parts = []
         current_part = []
-        prev_iter = chain([None], lines[:-1])
-        next_iter = chain(lines[1:], [None])
-        for prev_line, line, next_line in zip(prev_iter, lines, next_iter):
-            if (prev_line, line, next_line) == ('', '--', ''):
+        lines = iter(lines)
+        prev_line = None
+        line = next(lines, None)
+        while line is not None:
+            next_line = next(lines, None)
+            if line == '--' and prev_line == '' and next_line == '':
                 parts.append(current_part)
                 current_part = []
             else:
                 current_part.append(line)
+            prev_line, line = line, next_line
         if current_part:
             parts.append(current_part)
         items = [RTData.from_lines(part) for part in parts]
@@ -208,6 +420,10 @@ class RTMultipartData(Sequence):
         return '\n--\n\n'.join(item.serialize(serializer) for item in self)
 
     def deserialize(self, serializer=None):
+        if serializer is None:
+            # Share one serializer across parts rather than having each
+            # part create its own.
+            serializer = RTDataSerializer()
         return RTMultipartData([item.deserialize(serializer) for item in self])
 
     def __getitem__(self, index):
@@ -314,6 +530,32 @@ class RTCustomFields(MutableMapping):
 
     def __init__(self, container):
         self.container = container
+        # Bound once since they're used for every custom field access.
+        self._get = container.__getitem__
+        self._set = container.__setitem__
+        self._del = container.__delitem__
+        # Map of container key => custom field name for just the custom
+        # fields in the container, in container order. This is updated
+        # by the container as keys are added and removed so that custom
+        # fields can be iterated over and counted without scanning all
+        # of the container's keys.
+        self._names = {}
+
+    def _add(self, key):
+        if key not in self._names and isinstance(key, str):
+            cf_name = parse_cf_name(key)
+            if cf_name:
+                self._names[key] = cf_name
+
+    def _discard(self, key):
+        self._names.pop(key, None)
+
+    def _add_all(self, keys):
+        for key in keys:
+            self._add(key)
+
+    def _clear(self):
+        self._names.clear()
 
     def _cf_name(self, name):
         # 'name' => 'CF.{name}'
@@ -325,28 +567,25 @@ class RTCustomFields(MutableMapping):
     def __delitem__(self, name):
         cf_name = self._cf_name(name)
         try:
-            return self.container.__delitem__(cf_name)
+            return self._del(cf_name)
         except KeyError:
             raise KeyError(cf_name)
 
     def __getitem__(self, name):
         cf_name = self._cf_name(name)
         try:
-            return self.container.__getitem__(cf_name)
+            return self._get(cf_name)
         except KeyError:
             raise KeyError(cf_name)
 
     def __iter__(self):
-        for name in self.container:
-            cf_name = parse_cf_name(name)
-            if cf_name:
-                yield cf_name
+        return iter(self._names.values())
 
     def __len__(self):
-        return sum(1 for _ in self)
+        return len(self._names)
 
     def __setitem__(self, name, value):
-        return self.container.__setitem__(self._cf_name(name), value)
+        return self._set(self._cf_name(name), value)
 
 
 class RTDataSerializer:
@@ -360,6 +599,11 @@ class RTDataSerializer:
 
     multiline_fields = ('Content', 'Text')
 
+    # The datetime format that most recently converted a value; this is
+    # tried first because the datetimes in a response will generally all
+    # have the same format.
+    _last_datetime_format = None
+
     def deserialize(self, raw_data):
         """Convert raw string values returned from RT to Python.
 
@@ -371,15 +615,19 @@ class RTDataSerializer:
             RTData: A new RTData instance with converted values.
 
         """
-        data = RTData()
+        # The converted values are collected in a plain dict so that
+        # RTData only has to be constructed (and its custom fields
+        # indexed) once.
+        data = {}
+        conversion_map = self.conversion_map
         for name, value in raw_data.items():
-            if name in self.conversion_map:
-                type_name = self.conversion_map[name]
+            if name in conversion_map:
+                type_name = conversion_map[name]
                 converter_name = 'convert_to_%s' % type_name
                 converter = getattr(self, converter_name)
-                value = converter(raw_data.get(name))
+                value = converter(value)
             data[name] = value
-        return data
+        return RTData(data)
 
     def serialize(self, data):
         """Convert Python data to a string for RT.
@@ -392,21 +640,26 @@ class RTDataSerializer:
             str: The converted data as an RT content string.
 
         """
-        lines = []
-        for name, value in data.items():
-            if isinstance(value, Sequence) and not isinstance(value, str):
-                value = ', '.join(value).strip()
-            else:
-                value = str(value).strip()
-                if name in self.multiline_fields:
-                    value = value.splitlines()
-                    indentation = ' ' * (len(name) + 2)
-                    joiner = '\n{indentation}'.format(**locals())
-                    value = joiner.join(value)
-            lines.append('{name}: {value}'.format(name=name, value=value))
-        lines.append('')
-        content = '\n'.join(lines)
-        return content
+        items = data.items()
+        multiline_fields = self.multiline_fields
+        if any(isinstance(v, (list, tuple)) or n in multiline_fields for n, v in items):
+            return ''.join(f'{self._serialize_field(n, v)}\n' for n, v in items)
+        # Fast path for the common case where every value is a scalar
+        # on a single line.
+        return ''.join(f'{n}: {str(v).strip()}\n' for n, v in items)
+
+    def _serialize_field(self, name, value):
+        # Convert a single field to a 'name: value' line. Lists and
+        # tuples are converted to comma-separated lists. The lines of
+        # multiline fields are indented to line up with the first line.
+        if isinstance(value, (list, tuple)):
+            value = ', '.join(value).strip()
+        else:
+            value = str(value).strip()
+            if name in self.multiline_fields:
+                indentation = ' ' * (len(name) + 2)
+                value = f'\n{indentation}'.join(value.splitlines())
+        return f'{name}: {value}'
 
     def convert_to_datetime(self, string):
         """Convert a string as returned from RT to a ``datetime`` object.
@@ -421,11 +674,21 @@ class RTDataSerializer:
         """
         if not string:
             return None
-        for f in DATETIME_FORMATS:
+        last_format = self._last_datetime_format
+        if last_format is not None:
             try:
-                return datetime.strptime(string, f)
+                return datetime.strptime(string, last_format)
             except (TypeError, ValueError):
                 pass
+        for f in DATETIME_FORMATS:
+            if f == last_format:
+                continue
+            try:
+                value = datetime.strptime(string, f)
+            except (TypeError, ValueError):
+                continue
+            self._last_datetime_format = f
+            return value
         raise RTConversionError('datetime', string, 'Formats: {}'.format(DATETIME_FORMATS))
 
     def convert_to_list(self, string):
@@ -441,10 +704,8 @@ class RTDataSerializer:
         """
         if not string:
             return []
-        items = string.split(',')
-        items = [item.strip() for item in items]
-        items = [item for item in items if item]  # XXX: Necessary?
-        return items
+        items = (item.strip() for item in string.split(','))
+        return [item for item in items if item]
 
 
 class RTIDSerializer:
@@ -1,8 +1,10 @@
 import datetime
 import logging
 import time
-from queue import Queue
-from threading import Event, Lock, Thread
+import warnings
+from concurrent.futures import Future
+from queue import SimpleQueue
+from threading import Lock, Thread, Timer, TIMEOUT_MAX
 
 from .exc import RTAuthenticationError
 from .interface import RTInterface
@@ -12,7 +14,6 @@ log = logging.getLogger(__name__)
 
 
 MAX_WORKER_LIFETIME = datetime.datetime.max.timestamp()
-PENDING = object()
 
 
 class RTFrontEnd:
@@ -46,37 +47,68 @@ class RTFrontEnd:
                  **wrapped_args):
         self.wrapped_type = wrapped_type
         self.wrapped_args = wrapped_args
-        self.task_queue = Queue()
+        # All workers share a single task queue so that an idle worker
+        # can always pick up the next task, even when another worker is
+        # stuck on a slow request.
+        self.task_queue = SimpleQueue()
         self.worker_lifetime = worker_lifetime
         self.worker_lock = Lock()
         self.workers = [self.make_worker() for _ in range(num_workers)]
+        # Set when a dead worker couldn't be replaced; the next task
+        # added will retry replacing it.
+        self.missing_workers = False
 
     def make_worker(self):
         wrapped = self.wrapped_type(**self.wrapped_args)
-        worker = Worker(wrapped, self.task_queue, self.worker_lifetime)
+        worker = Worker(wrapped, self.task_queue, self.worker_lifetime, self.replace_worker)
         worker.start()
         return worker
 
-    def check_workers(self):
-        # Replace dead workers
+    def replace_worker(self, worker):
+        # Called from the worker's thread when it exits. Dead workers
+        # replace themselves so that adding a task doesn't have to check
+        # for dead workers. If a replacement can't be made, its slot is
+        # left empty and filled by :meth:`replace_missing_workers`.
+        with self.worker_lock:
+            index = self.workers.index(worker)
+            try:
+                self.workers[index] = self.make_worker()
+            except Exception:
+                log.exception('Could not replace worker %s', worker)
+                self.workers[index] = None
+                self.missing_workers = True
+
+    def replace_missing_workers(self):
+        # Errors are raised to the caller (i.e., whoever is adding a
+        # task) rather than leaving tasks queued with too few workers.
         with self.worker_lock:
-            new_workers = []
-            for worker in self.workers:
-                worker = self.make_worker() if worker.is_dead else worker
-                new_workers.append(worker)
-            self.workers = new_workers
+            for index, worker in enumerate(self.workers):
+                if worker is None:
+                    self.workers[index] = self.make_worker()
+            self.missing_workers = False
+
+    def check_workers(self):
+        """Replace dead workers.
+
+        Deprecated: Dead workers now replace themselves when they exit.
+        This only replaces workers that couldn't be replaced then.
+
+        """
+        warnings.warn(
+            'check_workers() is deprecated; dead workers replace themselves',
+            DeprecationWarning, stacklevel=2)
+        self.replace_missing_workers()
 
     def add_task(self, operation, args=(), kwargs=None):
-        self.check_workers()
+        if self.missing_workers:
+            self.replace_missing_workers()
         task = Task(operation, args, kwargs or {})
         self.task_queue.put(task)
         return task
 
     def get_result(self, task):
-        result = task.get_result()  # Waits until result is ready
-        if isinstance(result, Exception):
-            raise result
-        return result
+        # Waits until result is ready; raises if the task failed
+        return task.result()
 
     def add_task_and_wait_for_result(self, operation, args=(), kwargs=None):
         task = self.add_task(operation, args, kwargs)
@@ -121,12 +153,16 @@ class RTFrontEnd:
 
 class Worker(Thread):
 
-    def __init__(self, wrapped, task_queue, lifetime=MAX_WORKER_LIFETIME):
+    def __init__(self, wrapped, task_queue, lifetime=MAX_WORKER_LIFETIME, on_exit=None):
         super().__init__(daemon=True)
 
         self.wrapped = wrapped
         self.task_queue = task_queue
 
+        # This is called with the worker when it exits (after it's been
+        # disposed of).
+        self.on_exit = on_exit
+
         # A worker expires when the time elapsed from its start time is
         # greater than its lifetime. By default, workers live forever
         # (well, until Dec 31st, 9999 anyway).
@@ -134,14 +170,17 @@ class Worker(Thread):
         # These get set when the worker is started.
         self.start_time = None
         self.expires_at = None
+        self.expiration_timer = None
 
         # This flag is set to explicitly kill the worker. Workers are
-        # killed when they fail to finish a task.
+        # killed when they fail to finish a task and, via a timer, when
+        # they expire (so the clock doesn't have to be checked on every
+        # task).
         self.killed = False
 
     @property
     def is_dead(self):
-        return self.killed or self.has_expired
+        return self.killed
 
     @property
     def has_expired(self):
@@ -150,36 +189,55 @@ class Worker(Thread):
     def start(self):
         self.start_time = time.monotonic()
         self.expires_at = self.start_time + self.lifetime
+        # Timers can't wait longer than TIMEOUT_MAX (~292 years), which
+        # is as good as forever.
+        if self.lifetime < TIMEOUT_MAX:
+            self.expiration_timer = Timer(self.lifetime, self.kill)
+            self.expiration_timer.daemon = True
+            self.expiration_timer.start()
         return super().start()
 
     def run(self):
-        while not self.is_dead:
-            task = self.wait_for_task()
-            log.debug('Worker %s got task: %s', self, task)
-            try:
+        # The worker is always disposed of and replaced, even if
+        # something unexpected goes wrong while running.
+        try:
+            while not self.is_dead:
+                task = self.wait_for_task()
+                if not task.set_running_or_notify_cancel():
+                    log.debug('Worker %s skipped cancelled task: %s', self, task)
+                    continue
+                log.debug('Worker %s got task: %s', self, task)
                 try:
-                    result = self.perform_task(task)
-                except RTAuthenticationError:
-                    # Retry task one time if authentication fails, which
-                    # is an indication that the RT session has expired.
-                    log.debug('Retrying task...')
-                    self.wrapped.logout()
-                    result = self.perform_task(task)
-            except Exception as exc:
-                result = exc
-                self.kill()
-                log.debug('Worker %s killed', self)
-            self.finish_task(task, result)
-        self.dispose()
+                    try:
+                        result = self.perform_task(task)
+                    except RTAuthenticationError:
+                        # Retry task one time if authentication fails, which
+                        # is an indication that the RT session has expired.
+                        log.debug('Retrying task...')
+                        self.wrapped.logout()
+                        result = self.perform_task(task)
+                except Exception as exc:
+                    result = exc
+                    self.kill()
+                    log.debug('Worker %s killed', self)
+                self.finish_task(task, result)
+        finally:
+            if self.expiration_timer is not None:
+                self.expiration_timer.cancel()
+            self.dispose()
+            if self.on_exit is not None:
+                self.on_exit(self)
 
     def kill(self):
         self.killed = True
 
     def dispose(self):
+        # Closing logs out and releases the worker's connections, which
+        # would otherwise linger until garbage collection.
         try:
-            self.wrapped.logout()
+            self.wrapped.close()
         except Exception as exc:
-            log.warning('Logout failed while disposing of worker: %s', exc)
+            log.warning('Close failed while disposing of worker: %s', exc)
 
     def wait_for_task(self):
         return self.task_queue.get()
@@ -192,30 +250,27 @@ class Worker(Thread):
         return result
 
     def finish_task(self, task, result):
-        task.set_result(result)
-        self.task_queue.task_done()
+        if isinstance(result, Exception):
+            task.set_exception(result)
+        else:
+            task.set_result(result)
+
 
+class Task(Future):
 
-class Task:
+    """An RT operation to be performed by a :class:`Worker`.
 
-    __slots__ = ('operation', 'args', 'kwargs', 'ready', 'result')
+    The worker sets the task's result (or exception) when the operation
+    is finished. Tasks that are cancelled before a worker picks them up
+    are skipped.
+
+    """
 
     def __init__(self, operation, args, kwargs):
+        super().__init__()
         self.operation = operation
         self.args = args
         self.kwargs = kwargs
-        self.ready = Event()
-        self.result = PENDING
-
-    def get_result(self):
-        self.ready.wait()
-        return self.result
-
-    def set_result(self, result):
-        if self.result is not PENDING:
-            raise ValueError('Result already set for this task')
-        self.result = result
-        self.ready.set()
 
     def __str__(self):
         return '{0.operation}(*{0.args}, **{0.kwargs})'.format(self)
@@ -1,7 +1,7 @@
 import logging
-import re
+from functools import lru_cache
 
-from .data import RTData, RTLinesData, RTIDSerializer
+from .data import iter_content_lines, RTData, RTLinesData, RTIDSerializer
 from .exc import RTTicketCreationError, RTTicketNotFoundError, RTTicketUpdateError
 from .response import RTResponse
 from .session import RTSession
@@ -10,10 +10,117 @@ from .session import RTSession
 log = logging.getLogger(__name__)
 
 
+# Patterns for ticket status detail lines. These are no longer used
+# (see parse_ticket_detail) and are kept for backward compatibility.
 TICKET_NOT_FOUND_RE = r'^Ticket (?P<ticket_id>\d+) does not exist.$'
 TICKET_CREATED_RE = r'^Ticket (?P<ticket_id>\d+) created.$'
 TICKET_UPDATED_RE = r'^Ticket (?P<ticket_id>\d+) updated.$'
 
+# Ticket statuses in response detail lines like "Ticket 1234 created."
+TICKET_NOT_FOUND = 'does not exist.'
+TICKET_CREATED = 'created.'
+TICKET_UPDATED = 'updated.'
+TICKET_STATUSES = (TICKET_NOT_FOUND, TICKET_CREATED, TICKET_UPDATED)
+
+# format => (RT format, multipart)
+HISTORY_FORMATS = {
+    's': ('s', False),
+    'short': ('s', False),
+    'l': ('l', True),
+    'long': ('l', True),
+}
+
+# format => (RT format, data type, multipart, serializer)
+# The ID serializer is stateless, so a single instance is shared.
+_search_id_format = ('i', RTLinesData, False, RTIDSerializer('ticket'))
+_search_short_format = ('s', None, False, None)
+_search_long_format = ('l', None, True, None)
+SEARCH_FORMATS = {
+    'i': _search_id_format,
+    'id': _search_id_format,
+    's': _search_short_format,
+    'short': _search_short_format,
+    'l': _search_long_format,
+    'long': _search_long_format,
+}
+
+
+def parse_ticket_detail(detail):
+    """Parse ticket ID & status from a line like "Ticket 1234 created.".
+
+    This classifies a detail line with a single pass of plain string
+    operations rather than trying a regex per status::
+
+        >>> parse_ticket_detail('Ticket 1234 created.')
+        (1234, 'created.')
+        >>> parse_ticket_detail('Ticket 1234 does not exist.')
+        (1234, 'does not exist.')
+        >>> parse_ticket_detail('Something else.')
+        (None, None)
+
+    Args:
+        detail (str): A response detail line
+
+    Returns:
+        tuple: (ticket ID, status) where status is one of the TICKET_*
+            statuses or (None, None) if ``detail`` isn't a ticket status
+            line
+
+    """
+    if detail.startswith('Ticket '):
+        ticket_id, _, status = detail[7:].partition(' ')
+        if status in TICKET_STATUSES and ticket_id.isdecimal():
+            return int(ticket_id), status
+    return None, None
+
+
+def first_two_nonempty_lines(text):
+    """Get the first two non-empty lines of ``text``, stripped.
+
+    The text is split lazily (see :func:`rt.data.iter_content_lines`)
+    and scanning stops as soon as two lines are found, so this is cheap
+    even for large responses::
+
+        >>> first_two_nonempty_lines('RT/4.0.5 200 Ok\\n\\nNo matching results.\\n\\n')
+        ['RT/4.0.5 200 Ok', 'No matching results.']
+        >>> first_two_nonempty_lines('RT/4.0.5 200 Ok\\n\\n')
+        ['RT/4.0.5 200 Ok']
+
+    Args:
+        text (str)
+
+    Returns:
+        list: Zero, one, or two lines
+
+    """
+    lines = []
+    for line in iter_content_lines(text):
+        line = line.strip()
+        if line:
+            lines.append(line)
+            if len(lines) == 2:
+                break
+    return lines
+
+
+# Ticket paths are cached since the same tickets tend to be fetched and
+# updated repeatedly (e.g., in sync loops).
+
+
+@lru_cache(maxsize=1024)
+def ticket_show_path(ticket_id):
+    return f'ticket/{ticket_id}/show'
+
+
+@lru_cache(maxsize=1024)
+def ticket_edit_path(ticket_id):
+    return f'ticket/{ticket_id}/edit'
+
+
+@lru_cache(maxsize=1024)
+def ticket_history_path(ticket_id):
+    return f'ticket/{ticket_id}/history'
+
 
 class RTInterface:
 
@@ -31,52 +138,92 @@ class RTInterface:
         ticket_data = rt.get_ticket(...)
         rt.logout()
 
-    and ensures the RT session is closed out.
+    and ensures the RT session is logged out and closed.
+
+    The underlying :class:`RTSession` (and its connection pool) is kept
+    across logins/logouts. A preconfigured :class:`RTSession` (e.g.,
+    with custom adapters mounted for retries) can be passed via
+    ``session``; in that case, the session's own URL is used for
+    requests, so it should be the same as ``url``. Otherwise, a session
+    is created for ``url`` when it's first used.
 
     """
 
-    def __init__(self, url, username, password, default_queue=None):
+    def __init__(self, url, username, password, default_queue=None, session=None):
         self.url = url
         self.username = username
         self.password = password
         self.default_queue = default_queue
-        self.session = None
-        self.new_session()
+        self._session = None
+        if session is not None:
+            self.session = session
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = RTSession(self.url)
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        if not isinstance(session, RTSession):
+            raise TypeError(f'Expected an RTSession; got {session!r}')
+        if session.url != self.url:
+            log.warning(
+                'Session URL %s differs from interface URL %s; the session URL will be used',
+                session.url, self.url)
+        self._session = session
 
     def new_session(self):
-        if self.session:
-            self.session.close()
-        self.session = RTSession(self.url)
+        if self._session:
+            self._session.close()
+        self._session = RTSession(self.url)
 
     def __enter__(self):
         self.login()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.logout()
+        self.close()
+
+    def close(self):
+        """Log out and close the session's connections.
+
+        Logging out keeps the session's connection pool so that it can
+        be reused when logging back in; this discards it. A new session
+        will be created if the interface is used again.
+
+        """
+        if self._session is None:
+            return
+        try:
+            self.logout()
+        finally:
+            self._session.close()
+            self._session = None
 
     # Auth
 
     @property
     def logged_in(self):
-        return self.session.logged_in
+        return self._session is not None and self._session.logged_in
 
     def login(self):
         return self.session.login(self.username, self.password)
 
     def logout(self):
-        result = self.session.logout()
-        self.new_session()
-        return result
+        # There's nothing to log out of if the session was never created
+        if self._session is None:
+            return False
+        return self._session.logout()
 
     # Operations
 
     def get_ticket(self, ticket_id):
-        f = locals()
-        response = self.session.get('ticket/{ticket_id}/show'.format_map(f))
+        response = self.session.get(ticket_show_path(ticket_id))
         for detail in response.details:
-            not_found_match = re.search(TICKET_NOT_FOUND_RE, detail)
-            if not_found_match:
+            _, status = parse_ticket_detail(detail)
+            if status == TICKET_NOT_FOUND:
                 raise RTTicketNotFoundError(ticket_id)
         return response.data
 
@@ -100,27 +247,27 @@ class RTInterface:
         ))
         rt_data.update(data)
         content = rt_data.serialize()
-        response = self.session.post(path, data={'content': content})
+        # Only the detail lines of the response are needed
+        response = self.session.post(path, data={'content': content}, lazy=True)
         for detail in response.details:
-            match = re.search(TICKET_CREATED_RE, detail)
-            if match:
-                ticket_id = match.group('ticket_id')
+            ticket_id, status = parse_ticket_detail(detail)
+            if status == TICKET_CREATED:
                 return ticket_id
         raise RTTicketCreationError(content)
 
     def update_ticket(self, ticket_id, data):
-        path = 'ticket/{ticket_id}/edit'.format(ticket_id=ticket_id)
+        path = ticket_edit_path(ticket_id)
         rt_data = RTData((
             ('id', path),
         ))
         rt_data.update(data)
         content = rt_data.serialize()
-        response = self.session.post(path, data={'content': content})
+        # Only the detail lines of the response are needed
+        response = self.session.post(path, data={'content': content}, lazy=True)
         for detail in response.details:
-            match = re.search(TICKET_UPDATED_RE, detail)
-            if match:
-                ticket_id = match.group('ticket_id')
-                return ticket_id
+            updated_ticket_id, status = parse_ticket_detail(detail)
+            if status == TICKET_UPDATED:
+                return updated_ticket_id
         raise RTTicketUpdateError(content)
 
     def get_ticket_history(self, ticket_id, format='long'):
@@ -139,20 +286,16 @@ class RTInterface:
                 {ticket ID => description} pairs.
 
         """
-        path = 'ticket/{ticket_id}/history'.format(ticket_id=ticket_id)
-        params = {}
-        if format in ('s', 'short'):
-            multipart = False
-            params['format'] = 's'
-        elif format in ('l', 'long'):
-            multipart = True
-            params['format'] = 'l'
-        else:
-            raise ValueError('format must be one of "short" or "long"')
+        path = ticket_history_path(ticket_id)
+        try:
+            format, multipart = HISTORY_FORMATS[format]
+        except (KeyError, TypeError):
+            raise ValueError('format must be one of "short" or "long"') from None
+        params = {'format': format}
         response = self.session.post(path, params=params, multipart=multipart)
         for detail in response.details:
-            not_found_match = re.search(TICKET_NOT_FOUND_RE, detail)
-            if not_found_match:
+            _, status = parse_ticket_detail(detail)
+            if status == TICKET_NOT_FOUND:
                 raise RTTicketNotFoundError(ticket_id)
         return response.data
 
@@ -180,40 +323,28 @@ class RTInterface:
         """
         path = 'search/ticket'
 
-        if format in ('i', 'id'):
-            format = 'i'
-            data_type = RTLinesData
-            multipart = False
-            serializer = RTIDSerializer('ticket')
-        elif format in ('s', 'short'):
-            format = 's'
-            data_type = None
-            multipart = False
-            serializer = None
-        elif format in ('l', 'long'):
-            format = 'l'
-            data_type = None
-            multipart = True
-            serializer = None
-        else:
-            raise ValueError('format must be one of "id", "short", or "long"')
+        try:
+            format, data_type, multipart, serializer = SEARCH_FORMATS[format]
+        except (KeyError, TypeError):
+            raise ValueError('format must be one of "id", "short", or "long"') from None
 
         params = {
             'query': query,
             'format': format,
-            'orderby': '{order_direction}{order_by}'.format_map(locals()),
+            'orderby': f'{order_direction}{order_by}',
         }
 
         # TODO: Use custom search data type to handle "No matching results."
         response = self.session.get(path, params=params, parse_response=False)
 
-        lines = [line.strip() for line in response.text.splitlines()]
-        lines = [line for line in lines if line]
+        text = response.text
+        lines = first_two_nonempty_lines(text)
 
-        if lines[1] == 'No matching results.':
+        if len(lines) == 2 and lines[1] == 'No matching results.':
             return RTData()
 
         response = RTResponse.from_raw_response(
-            response, data_type=data_type, serializer=serializer, multipart=multipart)
+            response, text=text, data_type=data_type, serializer=serializer,
+            multipart=multipart)
 
         return response.data
@@ -3,20 +3,23 @@
 # dashes and may end with a question mark.
 CUSTOM_FIELD_RE = r'^CF\.\{(?P<name>[^{}]+)\}$'
 
-# Response header & detail lines.
-HEADER_RE = r'^RT/(?P<version>(\d+\.)+(\d+\.)*\d+)\s+(?P<status_code>\d{3})\s+(?P<reason>.+?)\s*$'
+# Response header & detail lines. The version consists of two or more
+# dot-separated numbers.
+HEADER_RE = r'^RT/(?P<version>\d+(?:\.\d+)+)\s+(?P<status_code>\d{3})\s+(?P<reason>.+?)\s*$'
 DETAIL_RE = r'^#\s*(?P<detail>.+?)\s*$'
 
 # Response lines consisting of a 'key: value' pair where `value` may be
-# empty and `key` can be one of 'CF.{name}' or 'name' where `name` can
+# empty and `key` can be one of 'name' or 'CF.{name}' where `name` can
 # contain letters, numbers, underscores, spaces, forward slashes, and
-# dashes and may end with a question mark.
+# dashes and may end with a question mark. Plain keys are far more
+# common, so they're tried first; the two alternatives can't match the
+# same key, so the order doesn't change what's matched.
 KEY_VALUE_LINE = (
     r'^'
-    r'(?P<key>('
-    r'CF\.\{[^{}]+\}'
-    r'|'
+    r'(?P<key>(?:'
     r'[\w -]+\??'
+    r'|'
+    r'CF\.\{[^{}]+\}'
     r'))'
     r':'
     r'\s*'
@@ -1,14 +1,23 @@
 import logging
-import re
+from itertools import chain
 
 
-from .data import content_to_lines, RTData, RTMultipartData
+from .data import content_to_lines, iter_content_lines, RTData, RTMultipartData
 from .exc import RTMalformedResponseHeaderError, RTMissingResponseHeaderError
-from .patterns import DETAIL_RE, HEADER_RE
 
 
 log = logging.getLogger(__name__)
 
+# Whitespace as matched by \s with re.ASCII
+ASCII_WHITESPACE = ' \t\n\r\f\v'
+
+# str.split() splits on all Unicode whitespace, including the ASCII
+# separators \x1c-\x1f. Masking the rest out before splitting means only
+# ASCII_WHITESPACE separates fields. (There's no whitespace past U+3000.)
+NON_ASCII_WHITESPACE = str.maketrans({
+    c: '\0' for c in map(chr, range(0x3001)) if c.isspace() and c not in ASCII_WHITESPACE
+})
+
 
 class RTResponse:
 
@@ -32,13 +41,18 @@ class RTResponse:
             method of the ``data_type`` instance.
         multipart: Whether the response has multiple parts (i.e.,
             whether it contains a list of results).
+        lazy: Defer parsing the data until ``data`` is first accessed.
+            This is useful when only the meta and detail lines are
+            needed (e.g., when creating or updating a ticket). Note
+            that errors in the data won't be raised until then either.
 
     Attributes:
         content: The unaltered response content. The first line of
             content is expected to be a meta line containing the RT
             version, response status code, and reason text.
         lines: The response content split into lines. Other than being
-            split into lines, the content is otherwise unaltered.
+            split into lines, the content is otherwise unaltered. This
+            is computed on access; parsing doesn't keep the lines.
         version: RT version from meta line.
         status_code: Status code extracted from meta line.
         reason: Reason text extracted from meta line.
@@ -57,79 +71,177 @@ class RTResponse:
         >>> RTResponse(content)  # doctest: +ELLIPSIS
         <rt.response.RTResponse object at ...>
 
+    The version, status code, and reason are parsed from the meta line::
+
+        >>> response = RTResponse('RT/4.0.5 404 Not Found\\n\\n')
+        >>> response.version, response.status_code, response.reason
+        ('4.0.5', '404', 'Not Found')
+
     Responses can have multiple detail lines::
 
         >>> content = 'RT/4.0.5 200 Ok\\n\\n# Ticket 1234 created.\\n# Ticket 1234 updated.\\n\\n'
         >>> RTResponse(content)  # doctest: +ELLIPSIS
         <rt.response.RTResponse object at ...>
 
+    With ``lazy=True``, the data isn't parsed until it's accessed::
+
+        >>> response = RTResponse('RT/4.0.5 200 Ok\\n\\nid: ticket/1\\n', lazy=True)
+        >>> response.data
+        RTData({'id': 'ticket/1'})
+
+    Errors in lazily parsed data are raised when the data is accessed
+    (every time it's accessed)::
+
+        >>> response = RTResponse('RT/4.0.5 200 Ok\\n\\nid: ticket/1\\noops\\n', lazy=True)
+        >>> response.data
+        Traceback (most recent call last):
+          ...
+        ValueError: Expected a continuation line starting with a space; got "oops"
+        >>> response.data
+        Traceback (most recent call last):
+          ...
+        ValueError: Expected a continuation line starting with a space; got "oops"
+
+    The blank line after the detail lines may be missing at the end of
+    a response::
+
+        >>> RTResponse('RT/4.0.5 200 Ok\\n\\n# Ticket 1234 created.').details
+        ['Ticket 1234 created.']
+
     TODO: Add more tests.
 
     """
 
-    def __init__(self, content, data_type=None, serializer=None, multipart=False):
+    __slots__ = (
+        'content', 'version', 'status_code', 'reason', 'details', '_data', '_data_error',
+        '_unparsed_data',
+        'raw_response',
+    )
+
+    def __init__(self, content, data_type=None, serializer=None, multipart=False, lazy=False):
         self.content = content
-        self.lines = lines = content_to_lines(content)
 
-        if not lines:
+        # The lines are consumed from an iterator: the header lines are
+        # parsed here and the rest are handed off to the data type.
+        # Content is split into lines as it's consumed.
+        lines = iter_content_lines(content)
+
+        meta_line = next(lines, None)
+        if meta_line is None:
             raise RTMissingResponseHeaderError(content)
 
-        meta = self.get_meta(lines[0])
+        meta = self.get_meta(meta_line)
         if meta is None:
             raise RTMalformedResponseHeaderError(content)
         self.version = meta['version']
         self.status_code = meta['status_code']
         self.reason = meta['reason']
-        lines = lines[1:]
 
-        if lines[0]:
+        if next(lines, ''):
             error_detail = 'Expected a blank line following the meta line'
             raise RTMalformedResponseHeaderError(content, error_detail)
-        lines = lines[1:]
 
         # A detail line or lines is optional. For multipart responses,
         # the detail line of the first part will be used.
-        self.details = []
-        i = 0
-        detail = self.get_detail(lines[i])
-        while detail:
-            self.details.append(detail)
-            i += 1
-            detail = self.get_detail(lines[i])
-
-        self.detail = '\n'.join(self.details)
-
-        if self.details:
-            if lines[len(self.details)]:
-                error_detail = 'Expected a blank line following detail line(s)'
-                raise RTMalformedResponseHeaderError(content, error_detail)
-
+        self.details = details = []
+        consumed_lines = []
+        # Bound once rather than looked up per line
+        get_detail = self.get_detail
+        add_detail = details.append
+        consume_line = consumed_lines.append
+        for line in lines:
+            consume_line(line)
+            # The line that ends the details usually isn't a comment, so
+            # the method call is skipped for it.
+            detail = line.startswith('#') and get_detail(line)
+            if not detail:
+                if details and line:
+                    error_detail = 'Expected a blank line following detail line(s)'
+                    raise RTMalformedResponseHeaderError(content, error_detail)
+                break
+            add_detail(detail)
+
+        # The detail lines are passed through to the data type too.
         data_type = data_type or (RTMultipartData if multipart else RTData)
-        self.data = data_type.from_lines(lines).deserialize(serializer)
+        lines = chain(consumed_lines, lines)
+        self._data_error = None
+        if lazy:
+            self._unparsed_data = (data_type, lines, serializer)
+        else:
+            self._unparsed_data = None
+            self._data = data_type.from_lines(lines).deserialize(serializer)
+
+    @property
+    def data(self):
+        if self._unparsed_data is not None:
+            data_type, lines, serializer = self._unparsed_data
+            try:
+                self._data = data_type.from_lines(lines).deserialize(serializer)
+            except Exception as exc:
+                # The remaining lines can only be consumed once, so the
+                # error is kept and raised again on later access.
+                self._data_error = exc
+            self._unparsed_data = None
+        if self._data_error is not None:
+            raise self._data_error
+        return self._data
+
+    @property
+    def detail(self):
+        return '\n'.join(self.details)
+
+    @property
+    def lines(self):
+        return content_to_lines(self.content)
 
     @classmethod
-    def from_raw_response(cls, response, **kwargs):
+    def from_raw_response(cls, response, text=None, **kwargs):
         """Create an instance from a "raw" response object.
 
         Args:
             response: A "raw" response object as returned from the
                 requests library.
+            text: The response's text, if the caller already has it.
+                ``response.text`` decodes the response content on
+                every access, so this avoids decoding it again.
             kwargs: Keyword args passed through to constructor.
 
         Returns:
             RTResponse
 
         """
-        rt_response = cls(response.text, **kwargs)
+        if text is None:
+            text = response.text
+        rt_response = cls(text, **kwargs)
         rt_response.raw_response = response
         return rt_response
 
     def get_meta(self, line):
-        match = re.search(HEADER_RE, line)
-        if match:
-            return match.groupdict()
+        # Equivalent to matching HEADER_RE with re.ASCII, but with plain
+        # string operations
+        if not line.startswith('RT/') or line[3:4].isspace():
+            return None
+        parts = line[3:].translate(NON_ASCII_WHITESPACE).split(None, 2)
+        if len(parts) != 3:
+            return None
+        version, status_code, reason = parts
+        # The reason is taken from the original line since it may
+        # contain masked characters
+        reason = line[len(line) - len(reason):]
+        # Only the reason may contain non-ASCII characters
+        if not line[:len(line) - len(reason)].isascii():
+            return None
+        version_parts = version.split('.')
+        if len(version_parts) < 2 or not all(p.isdecimal() for p in version_parts):
+            return None
+        if len(status_code) != 3 or not status_code.isdecimal():
+            return None
+        reason = reason.rstrip(ASCII_WHITESPACE)
+        if not reason or '\n' in reason:
+            return None
+        return {'version': version, 'status_code': status_code, 'reason': reason}
 
     def get_detail(self, line):
-        match = re.search(DETAIL_RE, line)
-        if match:
-            return match.group('detail').strip()
+        # Equivalent to matching DETAIL_RE but without the regex engine
+        if line.startswith('#'):
+            return line[1:].strip()
@@ -1,6 +1,6 @@
 import logging
 import textwrap
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from requests import Session as BaseSession
 
@@ -10,6 +10,11 @@ from .response import RTResponse
 
 log = logging.getLogger(__name__)
 
+# Characters other than letters and numbers that may appear in a path
+# that's joined to the base URL by simple concatenation. See
+# :meth:`RTSession.url_for_path`.
+SIMPLE_PATH_PUNCTUATION = str.maketrans('', '', '/_-')
+
 
 class RTSession(BaseSession):
 
@@ -20,8 +25,24 @@ class RTSession(BaseSession):
         self.url = url
         self.logged_in = False
 
-    def request(self, method, path, acceptable_status_codes=(200,), require_auth=True,
-                parse_response=True, data_type=None, serializer=None, multipart=False, **kwargs):
+    @property
+    def url(self):
+        return self._url
+
+    @url.setter
+    def url(self, url):
+        self._url = url
+        # The URL that relative paths are resolved against (only used
+        # for regular HTTP URLs)
+        scheme, netloc, *_ = urlsplit(url)
+        if scheme in ('http', 'https') and netloc:
+            self._base_url = urljoin(url, '.')
+        else:
+            self._base_url = None
+
+    def request(self, method, path, acceptable_status_codes=frozenset((200,)), require_auth=True,
+                parse_response=True, data_type=None, serializer=None, multipart=False, lazy=False,
+                **kwargs):
         """Perform a request in the current RT session.
 
         Args:
@@ -29,8 +50,8 @@ class RTSession(BaseSession):
                 through to requests.
             path: Path relative to base RT REST URL. This will be
                 combined with the base URL to get the full URL/path.
-            acceptable_status_codes (tuple): Only 200 responses are
-                acceptable by default.
+            acceptable_status_codes (set|tuple): Only 200 responses
+                are acceptable by default.
             require_auth: By default, authentication is required.
                 Generally speaking, only login & logout requests don't
                 require auth.
@@ -41,6 +62,7 @@ class RTSession(BaseSession):
             data_type: See :class:`RTResponse`.
             serializer: See :class:`RTResponse`.
             multipart: See :class:`RTResponse`.
+            lazy: See :class:`RTResponse`.
             kwargs: The remaining keyword args are passed as-is to the
                 super method.
 
@@ -60,37 +82,49 @@ class RTSession(BaseSession):
         response = super().request(method, url, **kwargs)
 
         status_code = response.status_code
-        response_text = response.text
 
         if status_code not in acceptable_status_codes:
             if status_code == 302:
                 # We don't pass the response content here because it's a
                 # big lump of HTML, and that's not very helpful.
                 raise RTAuthenticationError('Not authorized (session probably expired)')
-            raise RTUnexpectedStatusCodeError(status_code, response_text)
+            raise RTUnexpectedStatusCodeError(status_code, response.text)
 
         if parse_response:
             response = RTResponse.from_raw_response(
-                response, data_type=data_type, serializer=serializer, multipart=multipart)
+                response, data_type=data_type, serializer=serializer, multipart=multipart,
+                lazy=lazy)
 
-        log_level = log.getEffectiveLevel()
+        # The response text is only indented for logging when it will
+        # actually be logged.
         log_args = (method, url, response.status_code, response.reason)
-        if log_level == logging.DEBUG:
+        if log.isEnabledFor(logging.DEBUG):
+            # A parsed response already holds the decoded text, so it
+            # isn't decoded again here.
+            response_text = response.content if parse_response else response.text
             indented_text = textwrap.indent(response_text, ' ')
-            log_args = log_args + (indented_text,)
-            log.debug('%s %s %s "%s"\n%s', *log_args)
+            log.debug('%s %s %s "%s"\n%s', *log_args, indented_text)
         else:
             log.info('%s %s %s "%s"', *log_args)
 
         return response
 
     def url_for_path(self, path):
-        return urljoin(self.url, path)
+        # Paths like "ticket/1234/show" are the same as the base URL with
+        # the path appended, which is much cheaper than urljoin. Anything
+        # that urljoin might treat specially (e.g., absolute paths, full
+        # URLs, dot segments, empty segments, query strings) goes through
+        # urljoin.
+        base_url = self._base_url
+        if base_url is not None and path[:1] != '/' and '//' not in path:
+            if path.isascii() and path.translate(SIMPLE_PATH_PUNCTUATION).isalnum():
+                return base_url + path
+        return urljoin(self._url, path)
 
     # Auth
 
     auth_request_args = {
-        'acceptable_status_codes': (200, 302),
+        'acceptable_status_codes': frozenset((200, 302)),
         'parse_response': False,
         'require_auth': False,
     }
@@ -115,7 +149,7 @@ class RTSession(BaseSession):
         data = {'user': username, 'pass': password}
         response = self.post('', data=data, **self.auth_request_args)
         if response.status_code == 302:
-            self.close()  # Clear anonymous session state
+            self.cookies.clear()  # Clear anonymous session state
             raise RTAuthenticationError('Could not log in with the supplied credentials')
         self.logged_in = True
         return True
@@ -134,6 +168,8 @@ class RTSession(BaseSession):
         if not self.logged_in:
             return False
         response = self.post('logout', **self.auth_request_args)
-        self.close()
+        # Only the session state is cleared; the connection pool is kept
+        # so connections can be reused when logging back in.
+        self.cookies.clear()
         self.logged_in = False
         return response.status_code == 200
@@ -1,9 +1,10 @@
 import doctest
 
-from . import data, response
+from . import data, interface, response
 
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(data))
+    tests.addTests(doctest.DocTestSuite(interface))
     tests.addTests(doctest.DocTestSuite(response))
     return tests
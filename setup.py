@@ -15,6 +15,7 @@ setup(
     maintainer='Wyatt Baldwin',
     maintainer_email='wbaldwin@pdx.edu',
     packages=find_packages(),
+    python_requires='>=3.7',
     include_package_data=True,
     zip_safe=False,
     install_requires=[
@@ -30,8 +31,10 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
     ],
 )